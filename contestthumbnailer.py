@@ -1,23 +1,36 @@
 import argparse
+import concurrent.futures
 import datetime
+import functools
 import io
-import os
 import platform
 import re
+import struct
+import threading
+import zlib
 
 import beem
+import numpy as np
 import requests
-import tempfile
 
 from beem.comment import Comment
-from PIL import Image, ImageDraw, ImageFont
+from beem.utils import resolve_authorperm
+from beemapi.exceptions import RPCError
+from pathlib import Path
+from PIL import Image, ImageDraw, ImageFont, features
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 """
     Creates a thumbnail grid markup/markdown of all collage contest entries from the comments of a specific contest announcement post.
     
     Requirements:
     - https://github.com/holgern/beem (pip3 install -U beem)
-    - Python 3.x
+    - https://numpy.org (pip3 install -U numpy)
+    - Python 3.9+
+    
+    Optional (faster thumbnail posters):
+    - Pillow-SIMD built against libjpeg-turbo (pip3 uninstall Pillow; pip3 install -U pillow-simd)
     
     Example (Creating an HTML file):
     python3 contestthumbnailer.py -html 1 -a "@shaka/lets-make-a-collage-a-contest-for-all-creatives-on-hive-round-107-182-hive-in-the-prize-pool"
@@ -32,16 +45,37 @@ from PIL import Image, ImageDraw, ImageFont
 REGEX_IMAGE_URL = r'((?:https://.*\.(?:gif|jpg|png|jpeg))|(?:https://images\.hive\.blog/p/[A-Za-z0-9_\-@\/]*)|(?:https://images\.ecency\.com/p/[A-Za-z0-9_\-@\/]*))'
 REGEX_POST_URL = r'(https://(?:peakd\.com|hive\.blog|ecency\.com)/[a-z0-9_\-@\/]*)'
 
+_IMAGE_RE = re.compile(REGEX_IMAGE_URL)
+_POST_RE = re.compile(REGEX_POST_URL)
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+HIVE_IMAGE_PROXY_PREFIX = 'https://images.hive.blog/0x0/'
+
 DEFAULT_IMAGE_URL = 'https://files.peakd.com/file/peakd-hive/quantumg/23tSh9ZCk2m46Yy9XQeQErkwL99fsdQjsxH9A6T4WKyi7BCDs3y4Q6pE3zMfDF4ggv5TS.png'
 
 MAX_THUMBNAIL_WIDTH_IN_IMAGE = 160
+MAX_THUMBNAIL_HEIGHT_FACTOR_IN_IMAGE = 4
 THUMBNAIL_MARGIN_IN_IMAGE = 10
 MAX_THUMBNAILS_PER_ROW_IN_IMAGE = 20
 THUMBNAIL_LABEL_COLOR = (255, 255, 255)
 THUMBNAIL_POSTER_COLOR = (0, 0, 0, 0)
 IGNORE_DEFAULT_IMAGES_IN_POSTER = True
+THUMBNAIL_POSTER_COMPRESS_LEVEL = 1
+MAX_IMAGE_DOWNLOAD_WORKERS = 10
+MAX_CONCURRENT_IMAGE_REQUESTS = 6
+
+AUTHOR_BLACKLIST = frozenset(author.lower() for author in (
+    'gangstalking', 'ecency', 'beerlover', 'hivebuzz', 'kismeri', 'hashtag-booster', 'pizzabot', 'poshtoken'
+))
 
-AUTHOR_BLACKLIST = ['gangstalking', 'ecency', 'beerlover', 'hivebuzz', 'kismeri', 'hashtag-booster', 'pizzabot', 'poshtoken']
+_imageRequestSemaphore = threading.BoundedSemaphore(MAX_CONCURRENT_IMAGE_REQUESTS)
+
+_SESSION = requests.Session()
+_SESSION.mount(
+    'https://',
+    HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.2))
+)
 
 
 def _downloadImagesFromParsedComments(parsedComments: list, thumbnailWidth: int) -> list:
@@ -51,20 +85,29 @@ def _downloadImagesFromParsedComments(parsedComments: list, thumbnailWidth: int)
     :param parsedComments: A list of parsedComments.
     :return: A list of enhanced parsedComment dict objects.
     """
-    parsedCommentsOut = []
+    parsedComments = [
+        parsedComment for parsedComment in parsedComments
+        if not (IGNORE_DEFAULT_IMAGES_IN_POSTER and parsedComment['isDefaultImage'])
+    ]
+    results = {}
     unprocessed = 0
     print('Progress:', end=' ')
-    for parsedComment in parsedComments:
-        if IGNORE_DEFAULT_IMAGES_IN_POSTER and parsedComment['isDefaultImage']:
-            continue
-
-        parsedComment = _downloadImageFromParsedComment(parsedComment, thumbnailWidth)
-        if not parsedComment:
-            unprocessed += 1
-            continue
-
-        parsedCommentsOut.append(parsedComment)
-        print('.', end='')
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_IMAGE_DOWNLOAD_WORKERS) as executor:
+        futures = {
+            executor.submit(_downloadImageFromParsedComment, parsedComment, thumbnailWidth): index
+            for index, parsedComment in enumerate(parsedComments)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            parsedComment = future.result()
+            if not parsedComment:
+                unprocessed += 1
+                continue
+
+            results[futures[future]] = parsedComment
+            print('.', end='', flush=True)
+
+    # Keeps the order of the entries independent of the order the downloads finished in.
+    parsedCommentsOut = [results[index] for index in sorted(results)]
 
     if unprocessed > 0:
         print('Images not loadable(skipped): {imageAmount}\n'.format(imageAmount=unprocessed))
@@ -77,92 +120,191 @@ def _downloadImageFromParsedComment(parsedComment: dict, thumbnailWidth: int) ->
     Downlads a thumbnail image noted in a parsedComment dictionary.
 
     :param parsedComment A dictionary of thumbnail/image data.
-    :return: Enhanced parsedComment dict object that has then an additional 'imageObject' field.
+    :return: Enhanced parsedComment dict object that has then an additional, already decoded RGBA 'imageObject' field.
     """
     parsedComment['imageObject'] = None
-    buffer = tempfile.SpooledTemporaryFile(max_size=1e9)
-    r = requests.get(
-        'https://images.hive.blog/{x}x0/'.format(x=thumbnailWidth) + parsedComment['imageUrl'],
-        stream=True)
-    if r.status_code == 200:
-        downloaded = 0
-        for chunk in r.iter_content(chunk_size=1024):
-            downloaded += len(chunk)
-            buffer.write(chunk)
-        buffer.seek(0)
-        parsedComment['imageObject'] = Image.open(io.BytesIO(buffer.read()))
-    else:
-        parsedComment = None
-    buffer.close()
+    # Limits the requests in flight, so that the image proxy isn't flooded by the download workers.
+    with _imageRequestSemaphore:
+        with _SESSION.get(
+                'https://images.hive.blog/{x}x0/'.format(x=thumbnailWidth) + parsedComment['imageUrl']) as r:
+            if r.status_code != 200:
+                return None
+            content = r.content
+
+    image = Image.open(io.BytesIO(content))
+    # Lets libjpeg scale oversized JPEGs down while decoding. Other formats ignore this.
+    image.draft('RGB', (thumbnailWidth, thumbnailWidth))
+    # The image proxy doesn't scale every image down to the requested width, so oversized ones are shrunk here.
+    maxSize = (thumbnailWidth, thumbnailWidth * MAX_THUMBNAIL_HEIGHT_FACTOR_IN_IMAGE)
+    if image.size[0] > maxSize[0] or image.size[1] > maxSize[1]:
+        image.thumbnail(maxSize, Image.LANCZOS)
+    # Converting forces the lazy decode to happen here in the download worker instead of while composing the poster.
+    parsedComment['imageObject'] = image.convert('RGBA')
 
     return parsedComment
 
 
-def _calculateImageHeightByParsedComments(parsedCommentsWithImages: list, columns: int) -> int:
+def _layoutThumbnailPoster(parsedCommentsWithImages: list, thumbnailWidth: int, columns: int) -> tuple:
     """
-    Calculates the height of a thumbnail poster.
+    Calculates the positions of all thumbnails in a thumbnail poster and its height in a single pass.
 
-    :param parsedCommentsWithImage: A list of parsedComments which has additional imageObject fields.
-    :return: The height of the thumbnail grid inclusive margins.
+    :param parsedCommentsWithImages: A list of parsedComments which has additional imageObject fields.
+    :param thumbnailWidth: The width of a grid column.
+    :param columns: The amount of thumbnails per row.
+    :return: A tuple of the height of the thumbnail grid inclusive margins, the (x, y) position of every thumbnail
+             and the height of every row.
     """
-    height = THUMBNAIL_MARGIN_IN_IMAGE
-    col = 0
+    positions = []
+    rowHeights = []
+    x = y = THUMBNAIL_MARGIN_IN_IMAGE
     largest = 0
-    for parsedComment in parsedCommentsWithImages:
-        imageHeight = parsedComment['imageObject'].size[1] + THUMBNAIL_MARGIN_IN_IMAGE
-        col += 1
-        if col >= columns:
-            height += largest
-            col = 0
+    for index, parsedComment in enumerate(parsedCommentsWithImages):
+        imageHeight = parsedComment['imageObject'].size[1]
+        positions.append((x, y))
+        x += thumbnailWidth + THUMBNAIL_MARGIN_IN_IMAGE
+        if largest < imageHeight:
+            largest = imageHeight
+        if (index + 1) % columns == 0:
+            rowHeights.append(largest)
+            x = THUMBNAIL_MARGIN_IN_IMAGE
+            y += largest + THUMBNAIL_MARGIN_IN_IMAGE
             largest = 0
-        else:
-            if largest < imageHeight:
-                largest = imageHeight
 
-    if col > 0:
-        height += largest + THUMBNAIL_MARGIN_IN_IMAGE
+    if len(positions) % columns:
+        rowHeights.append(largest)
+        y += largest + THUMBNAIL_MARGIN_IN_IMAGE
+
+    return y, positions, rowHeights
+
+
+def _renderLabelSprite(label: str, fnt: ImageFont.FreeTypeFont) -> Image.Image:
+    """
+    Renders a thumbnail label including its shadow onto a transparent sprite.
+
+    :param label: The text of the label.
+    :param fnt: The font of the label.
+    :return: An RGBA image containing the label. Its shadow is offset by one pixel.
+    """
+    _, _, right, bottom = fnt.getbbox(label)
+    sprite = Image.new(mode="RGBA", size=(right + 1, bottom + 1), color=(0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    draw.text((1, 1), label, fill=(0, 0, 0), font=fnt)
+    draw.text((0, 0), label, fill=THUMBNAIL_LABEL_COLOR, font=fnt)
+
+    return sprite
+
+
+def _alphaBlit(canvas: np.ndarray, sprite: np.ndarray, x: int, y: int):
+    """
+    Blends an RGBA sprite onto an RGBA canvas by the sprite's alpha channel, like Image.paste with the sprite as mask.
+
+    :param canvas: The canvas as array of the shape (height, width, 4). It is modified in place.
+    :param sprite: The sprite as array of the shape (height, width, 4).
+    :param x: The left position of the sprite on the canvas.
+    :param y: The top position of the sprite on the canvas.
+    """
+    sprite = sprite[:max(0, canvas.shape[0] - y), :max(0, canvas.shape[1] - x)]
+    region = canvas[y:y + sprite.shape[0], x:x + sprite.shape[1]]
+    alpha = sprite[:, :, 3:].astype(np.uint16)
+    region[:] = ((sprite * alpha + region * (255 - alpha) + 127) // 255).astype(np.uint8)
+
+
+def _composeThumbnailPosterRow(parsedCommentsInRow: list, positions: list, rowHeight: int, width: int,
+                               fnt: ImageFont.FreeTypeFont, labelSprites: dict) -> np.ndarray:
+    """
+    Composes a single row of a thumbnail poster, so that only one row instead of the whole poster is worked on at once.
+
+    :param parsedCommentsInRow: The parsedComments of the row which have additional imageObject fields.
+    :param positions: The (x, y) position of every thumbnail of the row within the poster.
+    :param rowHeight: The height of the tallest thumbnail of the row.
+    :param width: The width of the poster.
+    :param fnt: The font of the labels.
+    :param labelSprites: A cache of already rendered label sprite arrays by author. Missing sprites are added.
+    :return: The row as RGBA array inclusive its bottom margin.
+    """
+    canvas = np.empty((rowHeight + THUMBNAIL_MARGIN_IN_IMAGE, width, 4), dtype=np.uint8)
+    canvas[:, :] = THUMBNAIL_POSTER_COLOR
+    for parsedComment, (x, _) in zip(parsedCommentsInRow, positions):
+        pixels = np.asarray(parsedComment['imageObject'])
+        canvas[:pixels.shape[0], x:x + pixels.shape[1]] = pixels
+
+    # Labels are blended after all thumbnails, since long ones may reach into the next thumbnail.
+    for parsedComment, (x, _) in zip(parsedCommentsInRow, positions):
+        author = parsedComment['author']
+        sprite = labelSprites.get(author)
+        if sprite is None:
+            sprite = labelSprites[author] = np.asarray(_renderLabelSprite(author, fnt))
+        _alphaBlit(canvas, sprite, x + 2, 2)
+
+    return canvas
+
+
+def _writePngChunk(pngFile, chunkType: bytes, data: bytes):
+    """
+    Writes a single chunk to a PNG file.
+
+    :param pngFile: The file opened for writing in binary mode.
+    :param chunkType: The four letter type of the chunk like b'IDAT'.
+    :param data: The payload of the chunk.
+    """
+    pngFile.write(struct.pack('>I', len(data)))
+    pngFile.write(chunkType)
+    pngFile.write(data)
+    pngFile.write(struct.pack('>I', zlib.crc32(chunkType + data)))
+
+
+def _encodePngScanlines(pixels: np.ndarray) -> bytes:
+    """
+    Encodes RGBA pixels as PNG scanlines using the Sub filter, which keeps neighboring equal pixels compressible.
+
+    :param pixels: The pixels as array of the shape (height, width, 4).
+    :return: The filtered scanlines, each prefixed by its filter type byte.
+    """
+    height = pixels.shape[0]
+    scanlines = pixels.reshape(height, -1)
+    filtered = np.empty((height, scanlines.shape[1] + 1), dtype=np.uint8)
+    filtered[:, 0] = 1
+    filtered[:, 1:5] = scanlines[:, :4]
+    np.subtract(scanlines[:, 4:], scanlines[:, :-4], out=filtered[:, 5:])
 
-    return height + THUMBNAIL_MARGIN_IN_IMAGE
+    return filtered.tobytes()
 
 
 def _createThumbnailPoster(parsedCommentsWithImage: list, thumbnailWidth: int, columns: int) -> bool:
     """
     Creates a thumbnail poster from all thumbnail in a parsedCommentsWithImage list.
+    Every row is compressed and written to the PNG file as soon as it is composed, so the poster is never held in
+    memory as a whole.
 
     :param parsedCommentsWithImage: A list of parsedComments which has additional imageObject fields.
     :return: True on success.
     """
-    hostImage = Image.new(
-        mode="RGBA",
-        size=(
-            ((thumbnailWidth + THUMBNAIL_MARGIN_IN_IMAGE) * columns) + THUMBNAIL_MARGIN_IN_IMAGE,
-            _calculateImageHeightByParsedComments(parsedCommentsWithImage, columns)
-        ),
-        color=THUMBNAIL_POSTER_COLOR
-    )
-    xy = (THUMBNAIL_MARGIN_IN_IMAGE, THUMBNAIL_MARGIN_IN_IMAGE)
-    col = 0
+    width = ((thumbnailWidth + THUMBNAIL_MARGIN_IN_IMAGE) * columns) + THUMBNAIL_MARGIN_IN_IMAGE
+    height, positions, rowHeights = _layoutThumbnailPoster(parsedCommentsWithImage, thumbnailWidth, columns)
+    topMargin = np.empty((THUMBNAIL_MARGIN_IN_IMAGE, width, 4), dtype=np.uint8)
+    topMargin[:, :] = THUMBNAIL_POSTER_COLOR
     # fnt = ImageFont.load_default()
     fnt = ImageFont.truetype("MadhouseCC0.ttf", 16)
-    draw = ImageDraw.Draw(hostImage)
-    largest = 0
-    for parsedComment in parsedCommentsWithImage:
-        thumbnail: Image = parsedComment['imageObject']
-        hostImage.paste(thumbnail, xy)
-        draw.text((xy[0] + 3, xy[1] + 3), parsedComment['author'], width=MAX_THUMBNAIL_WIDTH_IN_IMAGE,
-                  fill=(0, 0, 0), font=fnt)
-        draw.text((xy[0] + 2, xy[1] + 2), parsedComment['author'], width=MAX_THUMBNAIL_WIDTH_IN_IMAGE,
-                  fill=THUMBNAIL_LABEL_COLOR, font=fnt)
-        xy = (xy[0] + THUMBNAIL_MARGIN_IN_IMAGE + thumbnail.size[0], xy[1])
-        col += 1
-        if largest < thumbnail.size[1]:
-            largest = thumbnail.size[1]
-        if col >= MAX_THUMBNAILS_PER_ROW_IN_IMAGE:
-            col = 0
-            xy = (THUMBNAIL_MARGIN_IN_IMAGE, xy[1] + THUMBNAIL_MARGIN_IN_IMAGE + largest)
-            largest = 0
-
-    hostImage.save('GeneratedThumbnailPoster.png')
+    labelSprites = {}
+
+    with open('GeneratedThumbnailPoster.png', 'wb') as posterFile:
+        posterFile.write(_PNG_SIGNATURE)
+        # 8 bit depth, color type 6 (RGBA), deflate compression, adaptive filtering, no interlace.
+        _writePngChunk(posterFile, b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+        compressor = zlib.compressobj(THUMBNAIL_POSTER_COMPRESS_LEVEL)
+        # Rows are contiguous below the top margin, since each one includes its bottom margin.
+        idat = compressor.compress(_encodePngScanlines(topMargin))
+        for row, rowHeight in enumerate(rowHeights):
+            start = row * columns
+            rowPixels = _composeThumbnailPosterRow(
+                parsedCommentsWithImage[start:start + columns], positions[start:start + columns], rowHeight, width,
+                fnt, labelSprites)
+            idat += compressor.compress(_encodePngScanlines(rowPixels))
+            if idat:
+                _writePngChunk(posterFile, b'IDAT', idat)
+                idat = b''
+        _writePngChunk(posterFile, b'IDAT', idat + compressor.flush())
+        _writePngChunk(posterFile, b'IEND', b'')
 
     return True
 
@@ -170,6 +312,7 @@ def _createThumbnailPoster(parsedCommentsWithImage: list, thumbnailWidth: int, c
 def _fetchComments(hiveLink: str) -> list:
     """
     Fetches all comments of a specific hive post.
+    The whole discussion is fetched with a single bridge.get_discussion call instead of one call per replied comment.
 
     :param hiveLink: A Hive post link. Example: @user/this-is-a-post-permlink
     :return: A list of all comments of the post on success. Otherwise None.
@@ -177,29 +320,45 @@ def _fetchComments(hiveLink: str) -> list:
     hive = beem.Hive('https://api.deathwing.me')
 
     try:
-        post = Comment(hiveLink, blockchain_instance=hive)
+        author, permlink = resolve_authorperm(hiveLink)
     except ValueError:
         return None
 
-    return post.get_all_replies()
+    try:
+        discussion = hive.rpc.get_discussion({'author': author, 'permlink': permlink}, api='bridge')
+    except RPCError:
+        discussion = None
+
+    if not discussion:
+        # Falls back to fetching the replies level by level if the node doesn't serve the bridge API.
+        try:
+            post = Comment(hiveLink, blockchain_instance=hive)
+        except ValueError:
+            return None
+
+        return post.get_all_replies()
+
+    rootKey = '{author}/{permlink}'.format(author=author, permlink=permlink)
+    replies = [reply for key, reply in discussion.items() if key != rootKey]
+    replies.sort(key=lambda reply: (reply['depth'], reply['created']))
+
+    return [Comment(reply, lazy=True, blockchain_instance=hive) for reply in replies]
 
 
-def _findByRegex(text: str, regex: str) -> str:
+def _findByCompiled(text: str, pattern: re.Pattern) -> str:
     """
-    Finds and retrieves a string by a specific regex statement in a text.
+    Finds and retrieves a string by a specific precompiled regex pattern in a text.
 
     :param text: The source text.
-    :param regex: The regex statement.
+    :param pattern: The compiled regex pattern. Its first group is retrieved.
     :return: The text found on success. Otherwise an empty string.
     """
 
-    matches = re.search(regex, text, re.MULTILINE)
+    matches = pattern.search(text)
     if not matches:
         return ''
-    try:
-        return '' if not matches.group(1) else matches.group(1)
-    except IndexError:
-        return ''
+
+    return matches.group(1) or ''
 
 
 def _parseCommentBody(comment: Comment):
@@ -211,8 +370,8 @@ def _parseCommentBody(comment: Comment):
     """
 
     return {
-        'postUrl': _findByRegex(comment.body, REGEX_POST_URL),
-        'imageUrl': _findByRegex(comment.body, REGEX_IMAGE_URL).replace('https://images.hive.blog/0x0/', ''),
+        'postUrl': _findByCompiled(comment.body, _POST_RE),
+        'imageUrl': _findByCompiled(comment.body, _IMAGE_RE).removeprefix(HIVE_IMAGE_PROXY_PREFIX),
         'author': comment.author
     }
 
@@ -228,7 +387,7 @@ def _parseComments(comments: list) -> list:
     parsedComments = []
 
     for comment in comments:
-        if comment.author in AUTHOR_BLACKLIST:
+        if comment.author.lower() in AUTHOR_BLACKLIST:
             continue
 
         parsedComment = _parseCommentBody(comment)
@@ -245,23 +404,20 @@ def _parseComments(comments: list) -> list:
     return parsedComments
 
 
+@functools.lru_cache(maxsize=None)
 def _loadTemplateFile(filename: str) -> str:
     """
-    Loads a template file from disk.
+    Loads a template file from disk. Template files are cached, since they don't change during a run.
 
     :param filename: The path and the name of the file.
     :return: The string containing the content of the file on success. Otherwise None.
     """
 
-    if not os.path.isfile(filename):
+    try:
+        return Path(filename).read_text(encoding='utf-8')
+    except (FileNotFoundError, IsADirectoryError):
         return None
 
-    textFile = open(filename, "r")
-    content = textFile.read()
-    textFile.close()
-
-    return content
-
 
 def _createMarkdownFromParsedComments(parsedComments: list) -> str:
     """
@@ -276,14 +432,7 @@ def _createMarkdownFromParsedComments(parsedComments: list) -> str:
     if not bodyTemplate or not imageTemplate:
         return False
 
-    images = ''
-
-    for parsedComment in parsedComments:
-        images += imageTemplate.format(
-            postUrl=parsedComment['postUrl'],
-            imageUrl=parsedComment['imageUrl'],
-            author=parsedComment['author']
-        )
+    images = ''.join(imageTemplate.format_map(parsedComment) for parsedComment in parsedComments)
 
     return bodyTemplate.format(images=images)
 
@@ -301,17 +450,11 @@ def _createHtmlMarkupFromParsedComments(parsedComments: list) -> str:
     if not bodyTemplate or not imageTemplate:
         return False
 
-    images = ''
-
-    for parsedComment in parsedComments:
-        if not parsedComment['imageUrl'] and not parsedComment['postUrl']:
-            continue
-
-        image = imageTemplate.replace('{postUrl}', parsedComment['postUrl'])
-        image = image.replace('{imageUrl}', parsedComment['imageUrl'])
-        image = image.replace('{author}', parsedComment['author'])
-
-        images += image
+    # Only the image template is formatted; the body template contains CSS braces.
+    images = ''.join(
+        imageTemplate.format_map(parsedComment) for parsedComment in parsedComments
+        if parsedComment['imageUrl'] or parsedComment['postUrl']
+    )
 
     return bodyTemplate.replace('{images}', images)
 
@@ -337,6 +480,19 @@ def _saveMarkdownToDisk(markdown: str, saveAsHTMLFile: bool, specificName = None
     return True
 
 
+def _hasLibjpegTurbo() -> bool:
+    """
+    Checks whether Pillow is linked against libjpeg-turbo.
+
+    :return: True if libjpeg-turbo is used or if the installed Pillow can't tell.
+    """
+
+    try:
+        return features.check_feature('libjpeg_turbo')
+    except ValueError:
+        return True
+
+
 def main(args: dict) -> int:
     """
     Main function.
@@ -362,6 +518,8 @@ def main(args: dict) -> int:
     print('Found and parsed {x} relevant comments.'.format(x=len(parsedComments)))
 
     if args['img']:
+        if not _hasLibjpegTurbo():
+            print('Note: Pillow isn\'t linked against libjpeg-turbo. Decoding images might be slow.')
         print('Downloading images...')
         parsedCommentsWithImages = _downloadImagesFromParsedComments(parsedComments, args['thumbwidth'])
         print('Generating image...')